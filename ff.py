@@ -22,6 +22,8 @@ import tkinter as tk
 import random
 import math
 import time
+from collections import defaultdict
+from itertools import chain
 
 # ---------- GAME SETTINGS ----------
 WIDTH, HEIGHT = 900, 600
@@ -32,6 +34,8 @@ PLAYER_COLOR = "dodgerblue"
 BOT_COLOR = "orange"
 BULLET_COLOR = "black"
 FPS = 30
+SIM_DT = 1.0 / FPS  # fixed simulation timestep (decoupled from render rate)
+MAX_FRAME_TIME = 0.25  # clamp stalls so the sim doesn't spiral catching up
 MAX_BOTS = 10
 BOT_SPAWN_MARGIN = 60
 BULLET_SPEED = 12
@@ -45,6 +49,8 @@ INITIAL_ZONE_RADIUS = min(WIDTH, HEIGHT) * 0.45
 FINAL_ZONE_RADIUS = 60
 OUTSIDE_DAMAGE = 0.6  # HP lost per second outside zone
 MAX_HEALTH = 100
+GRID_CELL = 2 * BOT_RADIUS + BULLET_RADIUS  # broad-phase cell, >= max hit distance
+SPAWN_SIDES = ('top', 'bottom', 'left', 'right')
 
 # ---------- UTILITIES ----------
 
@@ -56,6 +62,13 @@ def distance(a, b):
     return math.hypot(a[0] - b[0], a[1] - b[1])
 
 
+def dist_sq(ax, ay, bx, by):
+    # Squared distance: enough for comparisons, skips the sqrt in hypot
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
 def normalize(vx, vy):
     mag = math.hypot(vx, vy)
     if mag == 0:
@@ -63,9 +76,38 @@ def normalize(vx, vy):
     return vx / mag, vy / mag
 
 
+_bullet_pool = []  # dead Bullet objects waiting to be reused
+
+
+def aim_bullet(shooter, target_x, target_y):
+    # Shared by player and bot firing: one normalize per shot gives both the
+    # bullet velocity and the muzzle offset, so the direction math is never
+    # done twice (no angles/trig involved anywhere). Bullets come from the
+    # free-list pool when one is available, so steady fire allocates nothing.
+    nx, ny = normalize(target_x - shooter.x, target_y - shooter.y)
+    offset = shooter.radius + BULLET_RADIUS + 1
+    x = shooter.x + nx * offset
+    y = shooter.y + ny * offset
+    vx = nx * BULLET_SPEED
+    vy = ny * BULLET_SPEED
+    if _bullet_pool:
+        bullet = _bullet_pool.pop()
+        bullet.reset(shooter, x, y, vx, vy)
+        return bullet
+    return Bullet(shooter, x, y, vx, vy)
+
+
 # ---------- ENTITY CLASSES ----------
 class Bullet:
+    __slots__ = ('owner', 'x', 'y', 'vx', 'vy', 'alive', 'item_id')
+
     def __init__(self, owner, x, y, vx, vy):
+        self.item_id = None  # persistent canvas oval, created on first render
+        self.reset(owner, x, y, vx, vy)
+
+    def reset(self, owner, x, y, vx, vy):
+        # (Re)arm this bullet - used both by __init__ and by the free-list
+        # pool when a dead bullet is recycled for a new shot
         self.owner = owner
         self.x = x
         self.y = y
@@ -73,14 +115,10 @@ class Bullet:
         self.vy = vy
         self.alive = True
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        if self.x < -50 or self.x > WIDTH + 50 or self.y < -50 or self.y > HEIGHT + 50:
-            self.alive = False
-
 
 class Entity:
+    __slots__ = ('x', 'y', 'radius', 'color', 'speed', 'hp', 'alive', 'item_id')
+
     def __init__(self, x, y, radius, color, speed):
         self.x = x
         self.y = y
@@ -89,6 +127,7 @@ class Entity:
         self.speed = speed
         self.hp = MAX_HEALTH
         self.alive = True
+        self.item_id = None  # persistent canvas oval, created on first render
 
     def hit(self, damage):
         self.hp -= damage
@@ -97,71 +136,81 @@ class Entity:
 
 
 class Player(Entity):
+    __slots__ = ('last_fire',)
+
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER_RADIUS, PLAYER_COLOR, PLAYER_SPEED)
         self.last_fire = 0
 
-    def can_fire(self):
-        return (time.time() - self.last_fire) >= FIRE_COOLDOWN
+    def can_fire(self, now):
+        return (now - self.last_fire) >= FIRE_COOLDOWN
 
-    def fire(self, target_x, target_y):
-        if not self.can_fire() or not self.alive:
+    def fire(self, target_x, target_y, now):
+        if not self.can_fire(now) or not self.alive:
             return None
-        dx, dy = target_x - self.x, target_y - self.y
-        nx, ny = normalize(dx, dy)
-        vx, vy = nx * BULLET_SPEED, ny * BULLET_SPEED
-        self.last_fire = time.time()
-        return Bullet(self, self.x + nx * (self.radius + BULLET_RADIUS + 1), self.y + ny * (self.radius + BULLET_RADIUS + 1), vx, vy)
+        self.last_fire = now
+        return aim_bullet(self, target_x, target_y)
 
 
 class Bot(Entity):
+    __slots__ = ('target', 'last_target_time', 'last_fire', 'hp_item', 'dead_marker')
+
     def __init__(self, x, y):
         super().__init__(x, y, BOT_RADIUS, BOT_COLOR, BOT_SPEED)
         self.target = None
         self.last_target_time = 0
         self.last_fire = 0
+        self.hp_item = None  # persistent HP-bar rectangle
+        self.dead_marker = None  # (line, line) ids of the X drawn once on death
 
     def choose_target(self, player, bots):
-        # Simple AI: target player if alive; otherwise nearest bot
+        # Simple AI: target player if alive; otherwise nearest living bot.
+        # At MAX_BOTS*2 bots a single squared-distance scan is cheaper than
+        # building any spatial tree for the query, and it allocates nothing.
         if player.alive:
             self.target = player
             return
-        living = [b for b in bots if b.alive and b is not self]
-        if not living:
-            self.target = None
-            return
-        self.target = min(living, key=lambda e: distance((self.x, self.y), (e.x, e.y)))
+        best = None
+        best_d = 0.0
+        sx, sy = self.x, self.y
+        for b in bots:
+            if not b.alive or b is self:
+                continue
+            d = dist_sq(sx, sy, b.x, b.y)
+            if best is None or d < best_d:
+                best = b
+                best_d = d
+        self.target = best
 
-    def update_ai(self, player, bots):
+    def update_ai(self, player, bots, now, rng):
         # Choose a new random wander target occasionally
-        if (time.time() - self.last_target_time) > 1.2 or self.target is None:
-            self.last_target_time = time.time()
-            if random.random() < 0.7 and player.alive:
-                self.target = player
+        if (now - self.last_target_time) > 1.2 or self.target is None:
+            self.last_target_time = now
+            if rng.random() < 0.7:
+                self.choose_target(player, bots)
             else:
+                self.target = None
+            if self.target is None:
                 # wander: random point in map
-                self.target = (random.uniform(0, WIDTH), random.uniform(0, HEIGHT))
+                self.target = (rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT))
 
-    def step(self, player, bots):
-        self.update_ai(player, bots)
+    def step(self, player, bots, now, rng):
+        self.update_ai(player, bots, now, rng)
         tx, ty = (self.target.x, self.target.y) if isinstance(self.target, Entity) else (self.target[0], self.target[1])
         dx, dy = tx - self.x, ty - self.y
         nx, ny = normalize(dx, dy)
         # random jitter to movement
         jitter = 0.2
-        self.x += (nx * self.speed) + random.uniform(-jitter, jitter)
-        self.y += (ny * self.speed) + random.uniform(-jitter, jitter)
+        self.x += (nx * self.speed) + rng.uniform(-jitter, jitter)
+        self.y += (ny * self.speed) + rng.uniform(-jitter, jitter)
         self.x = clamp(self.x, 0, WIDTH)
         self.y = clamp(self.y, 0, HEIGHT)
 
-    def try_fire(self, player):
+    def try_fire(self, player, rng):
         if not player.alive or not self.alive:
             return None
-        if random.random() < BOT_FIRE_CHANCE:
-            dx, dy = player.x - self.x, player.y - self.y
-            nx, ny = normalize(dx, dy)
-            vx, vy = nx * BULLET_SPEED, ny * BULLET_SPEED
-            return Bullet(self, self.x + nx * (self.radius + BULLET_RADIUS + 1), self.y + ny * (self.radius + BULLET_RADIUS + 1), vx, vy)
+        if rng.random() < BOT_FIRE_CHANCE:
+            return aim_bullet(self, player.x, player.y)
         return None
 
 
@@ -169,13 +218,25 @@ class Bot(Entity):
 class BattleRoyale:
     def __init__(self, master):
         self.master = master
-        self.canvas = tk.Canvas(master, width=WIDTH, height=HEIGHT, bg="lightgreen")
+        # Tk double-buffers canvas repaints internally, so persistent items +
+        # coords() updates are already flicker-free; highlightthickness=0
+        # drops the focus ring so it never has to be repainted with the scene
+        self.canvas = tk.Canvas(master, width=WIDTH, height=HEIGHT, bg="lightgreen", highlightthickness=0)
         self.canvas.pack()
 
         # Entities
         self.player = Player(WIDTH / 2, HEIGHT / 2)
         self.bots = []
         self.bullets = []
+        # maintained count of alive bots (bumped by spawn_bot, refreshed by
+        # the zone pass) so the respawn check and HUD never rescan the list
+        self.live_bots = 0
+
+        # Spatial grid rebuilt each frame so bullets only test nearby bots
+        self.grid = defaultdict(list)
+
+        # Game-local RNG: skips the module-level random's global state
+        self.rng = random.Random()
 
         # Input state
         self.keys = set()
@@ -193,8 +254,20 @@ class BattleRoyale:
         master.bind('<Button-1>', self.on_click)
         master.bind('<Motion>', self.on_motion)
 
-        # HUD
-        self.hud_text = None
+        # Persistent canvas items (created lazily on first render, then moved
+        # with coords()/itemconfig() instead of delete('all') + recreate)
+        self.zone_item = None
+        self.aim_item = None
+        self.hp_frame_item = None
+        self.hp_fill_item = None
+        self.hud_item = None
+        self.death_text_item = None
+        self.gameover_items = None
+        # Dirty-tracking caches: skip the Tcl call when nothing changed
+        self._last_zone_radius = None
+        self._last_hud = None
+        self._last_player_hp = None
+        self._last_aim = None
 
         # Start bots
         for _ in range(MAX_BOTS):
@@ -202,25 +275,28 @@ class BattleRoyale:
 
         # Start update loop
         self.last_time = time.time()
+        self.accumulator = 0.0
         self.running = True
         self.update_loop()
 
     def spawn_bot(self):
         # spawn at random edge-ish position
-        side = random.choice(['top', 'bottom', 'left', 'right'])
+        rng = self.rng
+        side = rng.choice(SPAWN_SIDES)
         if side == 'top':
-            x = random.uniform(0 + BOT_SPAWN_MARGIN, WIDTH - BOT_SPAWN_MARGIN)
-            y = random.uniform(0, BOT_SPAWN_MARGIN)
+            x = rng.uniform(0 + BOT_SPAWN_MARGIN, WIDTH - BOT_SPAWN_MARGIN)
+            y = rng.uniform(0, BOT_SPAWN_MARGIN)
         elif side == 'bottom':
-            x = random.uniform(0 + BOT_SPAWN_MARGIN, WIDTH - BOT_SPAWN_MARGIN)
-            y = random.uniform(HEIGHT - BOT_SPAWN_MARGIN, HEIGHT)
+            x = rng.uniform(0 + BOT_SPAWN_MARGIN, WIDTH - BOT_SPAWN_MARGIN)
+            y = rng.uniform(HEIGHT - BOT_SPAWN_MARGIN, HEIGHT)
         elif side == 'left':
-            x = random.uniform(0, BOT_SPAWN_MARGIN)
-            y = random.uniform(0 + BOT_SPAWN_MARGIN, HEIGHT - BOT_SPAWN_MARGIN)
+            x = rng.uniform(0, BOT_SPAWN_MARGIN)
+            y = rng.uniform(0 + BOT_SPAWN_MARGIN, HEIGHT - BOT_SPAWN_MARGIN)
         else:
-            x = random.uniform(WIDTH - BOT_SPAWN_MARGIN, WIDTH)
-            y = random.uniform(0 + BOT_SPAWN_MARGIN, HEIGHT - BOT_SPAWN_MARGIN)
+            x = rng.uniform(WIDTH - BOT_SPAWN_MARGIN, WIDTH)
+            y = rng.uniform(0 + BOT_SPAWN_MARGIN, HEIGHT - BOT_SPAWN_MARGIN)
         self.bots.append(Bot(x, y))
+        self.live_bots += 1
 
     # ---------- Input handlers ----------
     def on_keypress(self, event):
@@ -237,7 +313,7 @@ class BattleRoyale:
 
     def on_click(self, event):
         self.mouse_pos = (event.x, event.y)
-        bullet = self.player.fire(event.x, event.y)
+        bullet = self.player.fire(event.x, event.y, time.time())
         if bullet:
             self.bullets.append(bullet)
 
@@ -249,15 +325,28 @@ class BattleRoyale:
         if not self.running:
             return
         now = time.time()
-        dt = now - self.last_time
+        frame_time = now - self.last_time
         self.last_time = now
+        if frame_time > MAX_FRAME_TIME:
+            frame_time = MAX_FRAME_TIME
 
+        # Fixed-timestep accumulator: the sim always advances in SIM_DT
+        # steps, so slow frames run extra steps to catch up and fast frames
+        # skip the sim entirely - rendering never dictates game speed
         if not self.paused:
-            self.update(dt)
-        self.render()
-        self.master.after(int(1000 / FPS), self.update_loop)
-
-    def update(self, dt):
+            self.accumulator += frame_time
+            while self.accumulator >= SIM_DT and self.running:
+                self.update(SIM_DT, now)
+                self.accumulator -= SIM_DT
+        self.render(now)
+        # All the canvas mutations above happen inside this one callback, so
+        # Tk coalesces them into a single repaint at idle. Subtract the time
+        # the frame took from the delay so sim+render work does not stretch
+        # the frame period.
+        elapsed_ms = int((time.time() - now) * 1000)
+        self.master.after(max(1, int(1000 / FPS) - elapsed_ms), self.update_loop)
+
+    def update(self, dt, now):
         # Player movement
         move_x = move_y = 0
         if 'w' in self.keys or 'up' in self.keys:
@@ -278,109 +367,260 @@ class BattleRoyale:
         for bot in self.bots:
             if not bot.alive:
                 continue
-            bot.step(self.player, self.bots)
+            bot.step(self.player, self.bots, now, self.rng)
             # bot shooting
-            b = bot.try_fire(self.player)
+            b = bot.try_fire(self.player, self.rng)
             if b:
                 self.bullets.append(b)
 
-        # Bullets update
-        for bullet in list(self.bullets):
+        # Bullets update - gather the per-frame collision data once up front
+        # and compare squared distances, so the inner loop is just a few
+        # arithmetic ops per bullet/bot pair instead of tuple packing and
+        # math.hypot calls
+        # Freeze hot constants into locals: globals cost a dict lookup per
+        # use, locals an array index, and the collision loops touch these
+        # many times per bullet
+        width = WIDTH
+        height = HEIGHT
+        bullet_r = BULLET_RADIUS
+        grid_cell = GRID_CELL
+        reach = bullet_r + BOT_RADIUS
+        player = self.player
+        player_alive = player.alive
+        # The player does not move during the bullet pass, so read its
+        # position and radius once per frame instead of once per bullet
+        px = player.x
+        py = player.y
+        player_r = player.radius
+        # Broad phase: bucket alive bots into a uniform grid so each bullet
+        # only narrow-phase tests the few bots in its neighbouring cells
+        # instead of every bot on the map
+        grid = self.grid
+        # empty the buckets but keep the lists, so steady-state frames do no
+        # bucket reallocation (cell count is bounded by the map size)
+        for bucket in grid.values():
+            bucket.clear()
+        for bot in self.bots:
+            if bot.alive:
+                grid[(int(bot.x // grid_cell), int(bot.y // grid_cell))].append(bot)
+        # Compact the bullet list in place with a write index: remove() is an
+        # O(n) search per dead bullet (on top of the list() copy it forced),
+        # compaction is one pass total. Bullets that die this frame survive
+        # one pass and are dropped on the next.
+        bullets = self.bullets
+        write = 0
+        for bullet in bullets:
             if not bullet.alive:
-                self.bullets.remove(bullet)
+                # delete the oval here, not in render(): fixed-timestep
+                # catch-up can run several sim steps between renders, so a
+                # bullet dying mid-burst would never be seen dead by render()
+                # and would leak its oval. Then recycle the object for the
+                # next shot instead of leaving it to the GC.
+                if bullet.item_id is not None:
+                    self.canvas.delete(bullet.item_id)
+                    bullet.item_id = None
+                _bullet_pool.append(bullet)
+                continue
+            bullets[write] = bullet
+            write += 1
+            # integrate position inline - one method call per bullet per
+            # frame is pure dispatch overhead at this size
+            bx = bullet.x + bullet.vx
+            by = bullet.y + bullet.vy
+            bullet.x = bx
+            bullet.y = by
+            # out-of-bounds bullets can never hit anything (entities are
+            # clamped to the map), so cull them before any collision math
+            if bx < -50 or bx > width + 50 or by < -50 or by > height + 50:
+                bullet.alive = False
                 continue
-            bullet.update()
+            owner = bullet.owner
             # check collision with player
-            if bullet.owner is not self.player and self.player.alive:
-                if distance((bullet.x, bullet.y), (self.player.x, self.player.y)) <= (bullet.owner.radius + self.player.radius + BULLET_RADIUS):
-                    self.player.hit(18)
+            if owner is not player and player_alive:
+                dx = bx - px
+                dy = by - py
+                hit_r = owner.radius + player_r + bullet_r
+                if dx * dx + dy * dy <= hit_r * hit_r:
+                    player.hit(18)
+                    player_alive = player.alive
                     bullet.alive = False
                     continue
-            # check collision with bots
-            for bot in self.bots:
-                if not bot.alive or bullet.owner is bot:
-                    continue
-                if distance((bullet.x, bullet.y), (bot.x, bot.y)) <= (BULLET_RADIUS + bot.radius):
-                    bot.hit(22)
-                    bullet.alive = False
+            # check collision with bots in the bullet's grid neighbourhood
+            # (re-test alive: an earlier bullet may have killed the bot this
+            # frame)
+            cx0 = int((bx - reach) // grid_cell)
+            cy0 = int((by - reach) // grid_cell)
+            cx1 = int((bx + reach) // grid_cell)
+            cy1 = int((by + reach) // grid_cell)
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = grid.get((cx, cy))
+                    if not bucket:
+                        continue
+                    for bot in bucket:
+                        if not bot.alive or owner is bot:
+                            continue
+                        dx = bx - bot.x
+                        dy = by - bot.y
+                        hit_r = bullet_r + bot.radius
+                        if dx * dx + dy * dy <= hit_r * hit_r:
+                            bot.hit(22)
+                            bullet.alive = False
+                            break
+                    if not bullet.alive:
+                        break
+                if not bullet.alive:
                     break
+        del bullets[write:]
 
         # Zone update (shrinking)
-        game_elapsed = time.time() - self.start_time
+        game_elapsed = now - self.start_time
         if game_elapsed < ZONE_SHRINK_START:
             self.zone_radius = INITIAL_ZONE_RADIUS
         else:
             t = clamp((game_elapsed - ZONE_SHRINK_START) / ZONE_SHRINK_DURATION, 0, 1)
             self.zone_radius = INITIAL_ZONE_RADIUS + (FINAL_ZONE_RADIUS - INITIAL_ZONE_RADIUS) * t
 
-        # Damage outside zone
-        for ent in [self.player] + self.bots:
+        # Damage outside zone and count survivors in the same pass - chain()
+        # walks player + bots without building throwaway concatenated lists
+        # every frame
+        zx, zy = self.zone_center
+        zone_r_sq = self.zone_radius * self.zone_radius
+        zone_damage = OUTSIDE_DAMAGE * dt * 60  # scale by dt roughly
+        living = 0
+        for ent in chain((self.player,), self.bots):
             if not ent.alive:
                 continue
-            if distance((ent.x, ent.y), self.zone_center) > self.zone_radius:
-                ent.hit(OUTSIDE_DAMAGE * dt * 60)  # scale by dt roughly
+            dx = ent.x - zx
+            dy = ent.y - zy
+            if dx * dx + dy * dy > zone_r_sq:
+                ent.hit(zone_damage)
+            if ent.alive:
+                living += 1
+        self.live_bots = living - 1 if self.player.alive else living
 
         # Remove dead bots occasionally
         # (keep their bodies so you can see them - but we mark alive False)
 
         # Win/loss conditions
-        living = [e for e in ([self.player] + self.bots) if e.alive]
-        if len(living) <= 1:
+        if living <= 1:
             self.running = False
-            self.end_time = time.time()
+            self.end_time = now
 
         # Ensure at least some bots exist earlier in the game
-        live_bots = sum(1 for b in self.bots if b.alive)
-        if live_bots < max(2, MAX_BOTS // 3) and len(self.bots) < MAX_BOTS * 2:
-            if random.random() < 0.02:
+        if self.live_bots < max(2, MAX_BOTS // 3) and len(self.bots) < MAX_BOTS * 2:
+            if self.rng.random() < 0.02:
                 self.spawn_bot()
 
     # ---------- RENDER ----------
-    def render(self):
-        self.canvas.delete('all')
-        # draw zone (semi-opaque)
-        x, y = self.zone_center
+    def render(self, now):
+        # Every item is created once and then only moved with coords() /
+        # retagged with itemconfig() - recreating items each frame makes Tk
+        # reparse options and rebuild its display list, which dominates frame
+        # time once there are more than a handful of bots and bullets.
+        canvas = self.canvas
+
+        # zone (single persistent oval, moved only when the radius changes -
+        # it is static before the shrink starts and after it finishes)
         r = self.zone_radius
-        self.canvas.create_oval(x - r, y - r, x + r, y + r, fill='', outline='red', width=2)
+        if r != self._last_zone_radius:
+            x, y = self.zone_center
+            if self.zone_item is None:
+                self.zone_item = canvas.create_oval(x - r, y - r, x + r, y + r, fill='', outline='red', width=2)
+            else:
+                canvas.coords(self.zone_item, x - r, y - r, x + r, y + r)
+            self._last_zone_radius = r
 
-        # bullets
+        # bullets (bind the canvas methods once - the loop body is otherwise
+        # dominated by attribute lookups at high bullet counts)
+        bullet_r = BULLET_RADIUS
+        coords = canvas.coords
         for b in self.bullets:
-            if b.alive:
-                self.canvas.create_oval(b.x - BULLET_RADIUS, b.y - BULLET_RADIUS, b.x + BULLET_RADIUS, b.y + BULLET_RADIUS, fill=BULLET_COLOR)
+            if not b.alive:
+                if b.item_id is not None:
+                    canvas.delete(b.item_id)
+                    b.item_id = None
+                continue
+            if b.item_id is None:
+                b.item_id = canvas.create_oval(b.x - bullet_r, b.y - bullet_r, b.x + bullet_r, b.y + bullet_r, fill=BULLET_COLOR)
+            else:
+                coords(b.item_id, b.x - bullet_r, b.y - bullet_r, b.x + bullet_r, b.y + bullet_r)
 
         # bots
+        max_health = MAX_HEALTH
         for bot in self.bots:
             if bot.alive:
-                self.canvas.create_oval(bot.x - bot.radius, bot.y - bot.radius, bot.x + bot.radius, bot.y + bot.radius, fill=bot.color)
-                # HP bar
+                if bot.item_id is None:
+                    bot.item_id = canvas.create_oval(bot.x - bot.radius, bot.y - bot.radius, bot.x + bot.radius, bot.y + bot.radius, fill=bot.color)
+                else:
+                    canvas.coords(bot.item_id, bot.x - bot.radius, bot.y - bot.radius, bot.x + bot.radius, bot.y + bot.radius)
+                # HP bar (moves with the bot, so coords every frame)
                 hpw = 20
-                self.canvas.create_rectangle(bot.x - hpw / 2, bot.y - bot.radius - 8, bot.x - hpw / 2 + (hpw * (bot.hp / MAX_HEALTH)), bot.y - bot.radius - 4, fill='green')
-            else:
-                # dead bot marker
-                self.canvas.create_line(bot.x - 8, bot.y - 8, bot.x + 8, bot.y + 8, fill='gray')
-                self.canvas.create_line(bot.x - 8, bot.y + 8, bot.x + 8, bot.y - 8, fill='gray')
+                bx0 = bot.x - hpw / 2
+                by0 = bot.y - bot.radius - 8
+                bx1 = bx0 + (hpw * (bot.hp / max_health))
+                by1 = bot.y - bot.radius - 4
+                if bot.hp_item is None:
+                    bot.hp_item = canvas.create_rectangle(bx0, by0, bx1, by1, fill='green')
+                else:
+                    canvas.coords(bot.hp_item, bx0, by0, bx1, by1)
+            elif bot.dead_marker is None:
+                # swap the live items for a static X marker, drawn once
+                if bot.item_id is not None:
+                    canvas.delete(bot.item_id)
+                    bot.item_id = None
+                if bot.hp_item is not None:
+                    canvas.delete(bot.hp_item)
+                    bot.hp_item = None
+                bot.dead_marker = (
+                    canvas.create_line(bot.x - 8, bot.y - 8, bot.x + 8, bot.y + 8, fill='gray'),
+                    canvas.create_line(bot.x - 8, bot.y + 8, bot.x + 8, bot.y - 8, fill='gray'),
+                )
 
         # player
-        if self.player.alive:
-            self.canvas.create_oval(self.player.x - self.player.radius, self.player.y - self.player.radius, self.player.x + self.player.radius, self.player.y + self.player.radius, fill=self.player.color)
-            # draw aiming line
+        player = self.player
+        if player.alive:
+            if player.item_id is None:
+                player.item_id = canvas.create_oval(player.x - player.radius, player.y - player.radius, player.x + player.radius, player.y + player.radius, fill=player.color)
+            else:
+                canvas.coords(player.item_id, player.x - player.radius, player.y - player.radius, player.x + player.radius, player.y + player.radius)
+            # aiming line (endpoints move only when the player or mouse does)
             mx, my = self.mouse_pos
-            self.canvas.create_line(self.player.x, self.player.y, mx, my, dash=(3, 2))
-            # HP bar
-            self.canvas.create_rectangle(10, 10, 210, 26, fill='black')
-            self.canvas.create_rectangle(12, 12, 12 + (196 * (self.player.hp / MAX_HEALTH)), 24, fill='lime')
-        else:
-            self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 40, text='YOU DIED', font=('Helvetica', 32), fill='darkred')
+            aim = (player.x, player.y, mx, my)
+            if aim != self._last_aim:
+                if self.aim_item is None:
+                    self.aim_item = canvas.create_line(player.x, player.y, mx, my, dash=(3, 2))
+                else:
+                    canvas.coords(self.aim_item, player.x, player.y, mx, my)
+                self._last_aim = aim
+            # HP bar (fill resized only when hp changes)
+            if self.hp_frame_item is None:
+                self.hp_frame_item = canvas.create_rectangle(10, 10, 210, 26, fill='black')
+                self.hp_fill_item = canvas.create_rectangle(12, 12, 12 + (196 * (player.hp / MAX_HEALTH)), 24, fill='lime')
+                self._last_player_hp = player.hp
+            elif player.hp != self._last_player_hp:
+                canvas.coords(self.hp_fill_item, 12, 12, 12 + (196 * (player.hp / MAX_HEALTH)), 24)
+                self._last_player_hp = player.hp
+        elif self.death_text_item is None:
+            for item in (player.item_id, self.aim_item, self.hp_frame_item, self.hp_fill_item):
+                if item is not None:
+                    canvas.delete(item)
+            player.item_id = self.aim_item = self.hp_frame_item = self.hp_fill_item = None
+            self.death_text_item = canvas.create_text(WIDTH / 2, HEIGHT / 2 - 40, text='YOU DIED', font=('Helvetica', 32), fill='darkred')
 
         # HUD info
-        now = time.time()
         elapsed = now - self.start_time
-        info = f"Time: {int(elapsed)}s  Bots alive: {sum(1 for b in self.bots if b.alive)}  Zone: {int(self.zone_radius)}"
+        info = f"Time: {int(elapsed)}s  Bots alive: {self.live_bots}  Zone: {int(self.zone_radius)}"
         if self.paused:
             info = "PAUSED - press P to resume\n" + info
-        self.canvas.create_text(WIDTH - 250, 18, text=info, anchor='ne', font=('Helvetica', 12))
+        if info != self._last_hud:
+            if self.hud_item is None:
+                self.hud_item = canvas.create_text(WIDTH - 250, 18, text=info, anchor='ne', font=('Helvetica', 12))
+            else:
+                canvas.itemconfig(self.hud_item, text=info)
+            self._last_hud = info
 
-        if not self.running:
+        if not self.running and self.gameover_items is None:
             winner = None
             if self.player.alive:
                 winner = 'Player (You)'
@@ -390,23 +630,42 @@ class BattleRoyale:
                     winner = 'Bot'
                 else:
                     winner = 'No one'
-            self.canvas.create_rectangle(WIDTH / 2 - 200, HEIGHT / 2 - 80, WIDTH / 2 + 200, HEIGHT / 2 + 80, fill='white', outline='black')
-            self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 20, text=f'GAME OVER', font=('Helvetica', 26), fill='black')
-            self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 10, text=f'Winner: {winner}', font=('Helvetica', 18), fill='black')
-            self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 40, text='Press ESC to close window or R to restart', font=('Helvetica', 12), fill='gray')
+            self.gameover_items = (
+                canvas.create_rectangle(WIDTH / 2 - 200, HEIGHT / 2 - 80, WIDTH / 2 + 200, HEIGHT / 2 + 80, fill='white', outline='black'),
+                canvas.create_text(WIDTH / 2, HEIGHT / 2 - 20, text=f'GAME OVER', font=('Helvetica', 26), fill='black'),
+                canvas.create_text(WIDTH / 2, HEIGHT / 2 + 10, text=f'Winner: {winner}', font=('Helvetica', 18), fill='black'),
+                canvas.create_text(WIDTH / 2, HEIGHT / 2 + 40, text='Press ESC to close window or R to restart', font=('Helvetica', 12), fill='gray'),
+            )
 
     # ---------- External controls: restart / quit ----------
     def restart(self, event=None):
-        # quick restart: re-create entities
+        # quick restart: re-create entities (and their canvas items)
+        self.canvas.delete('all')
+        self.zone_item = None
+        self.aim_item = None
+        self.hp_frame_item = None
+        self.hp_fill_item = None
+        self.hud_item = None
+        self.death_text_item = None
+        self.gameover_items = None
+        self._last_zone_radius = None
+        self._last_hud = None
+        self._last_player_hp = None
+        self._last_aim = None
         self.player = Player(WIDTH / 2, HEIGHT / 2)
         self.bots = []
         self.bullets = []
+        self.live_bots = 0
+        # the delete('all') above invalidated every canvas id, so pooled
+        # bullets must not carry theirs into the new round
+        _bullet_pool.clear()
         for _ in range(MAX_BOTS):
             self.spawn_bot()
         self.start_time = time.time()
         self.running = True
         self.paused = False
         self.last_time = time.time()
+        self.accumulator = 0.0
 
 
 # ---------- RUN ----------